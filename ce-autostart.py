@@ -13,42 +13,181 @@ Commands:
   remove-all-launchoptions      - Remove LaunchOptions from all games with them set
 """
 
+import fcntl
+import os
+import pickle
+import select
+import shutil
 import subprocess
 import sys
+import termios
+import time
 from pathlib import Path
 import tomllib  # Python 3.11+
 import tomli_w
 import json
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime
 import re
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import mmap
+import sqlite3
 from rich.table import Table
-from rich.console import Console
+from rich.console import Console, Group
 from rich.text import Text
+from rich.live import Live
+from rich.prompt import Prompt
+from rich.cells import cell_len
 
 # Cache for compiled regex patterns
 _EXCLUDED_PATTERNS_CACHE = {}
 
+# VDF tokens: a quoted string (unterminated runs to the end), a brace, or a // comment.
+# Backslash escapes such as \" stay inside the string and are kept verbatim,
+# so values round-trip unchanged through write_vdf.
+_VDF_TOKEN_RE = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"?|([{}])|//[^\n]*', re.S)
+_VDF_TOKEN_BYTES_RE = re.compile(_VDF_TOKEN_RE.pattern.encode(), re.S)
+
+# Manifest file names in a steamapps directory, capturing the app ID
+_MANIFEST_FILE_RE = re.compile(r"appmanifest_([0-9]+)\.acf")
+
+# Matches the "name" entry of an appmanifest_*.acf file: "name"		"Game Title"
+_MANIFEST_NAME_RE = re.compile(rb'"name"\s+"([^"]*)"')
+
+# Matches the manifest fields read by get_game_info, mapped to their game_info keys
+_MANIFEST_FIELDS_RE = re.compile(rb'"(name|executable|installdir)"\s+"([^"]*)"')
+_MANIFEST_FIELD_KEYS = {b"name": "name", b"executable": "executable", b"installdir": "install_dir"}
+
+# Matches an app block of localconfig.vdf that sets LaunchOptions before any
+# nested block, capturing the app ID and the (escape-aware) value
+_LAUNCH_OPTIONS_RE = re.compile(rb'"([0-9]+)"\s*\{[^{}]*?"LaunchOptions"\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+
+# Option list shown for a selected game in the interactive menu, built once
+GAME_OPTIONS_TEXT = Text.from_markup(
+    "[cyan]Options:[/cyan]\n"
+    "[bold]M[/bold] - Modify LaunchOptions\n"
+    "[bold]V[/bold] - View Current LaunchOptions\n"
+    "[bold]R[/bold] - Remove LaunchOptions\n"
+    "[bold]A[/bold] - Modify All Games LaunchOptions\n"
+    "[bold]D[/bold] - Remove All Games LaunchOptions\n"
+    "[bold]C[/bold] - Cancel (back to menu)\n"
+)
+
+USAGE = """\
+Usage:
+  ce-autostart.py init                            - Interactive configuration setup
+  ce-autostart.py [start] [uid] [--exe PATH]      - Start CheatEngine for a game
+  ce-autostart.py menu                            - Interactive game browser and manager
+  ce-autostart.py modify-launchoptions <ID>       - Set LaunchOptions for a game
+  ce-autostart.py modify-all-launchoptions        - Set LaunchOptions for all games
+  ce-autostart.py remove-launchoptions <ID>       - Remove LaunchOptions from a game
+  ce-autostart.py remove-all-launchoptions        - Remove LaunchOptions from all games
+"""
+
+INIT_BANNER = f"""\
+{"=" * 60}
+CheatEngine Auto-Start Configuration Setup
+{"=" * 60}"""
+
+# Reused buffer for raw keypress reads in the interactive menu. Keys read
+# together with the current one (held keys, type-ahead, pastes) stay pending
+# between the offsets in _KEY_PENDING and are returned by later calls.
+_KEY_BUFFER = bytearray(64)
+_KEY_PENDING = [0, 0]
+
+# Column widths of the menu table. The name column gets the room that is left,
+# up to MENU_NAME_MAX_WIDTH; the overhead is four vertical borders plus one
+# space of padding on each side of the three columns.
+MENU_ID_WIDTH = 10
+MENU_STATUS_WIDTH = 19
+MENU_NAME_MAX_WIDTH = 60
+MENU_TABLE_OVERHEAD_WIDTH = 4 + 3 * 2
+
+# Lines of the menu that are not game rows: the table title, borders and
+# header, plus the line the cursor rests on below the footer
+MENU_TABLE_CHROME_LINES = 6
+
+# How long to wait for the rest of an escape sequence before treating ESC as a key
+ESCAPE_SEQUENCE_TIMEOUT = 0.05
+
 CONFIG_PATHS = [
     Path.home() / ".config" / "ce-autostart" / "config.toml",
     Path.cwd() / "ce-autostart-config.toml",
     Path.cwd() / "config.toml",
 ]
 
+# Directory where 'protonhax init' registers running games, one entry per uid
+PROTONHAX_RUN_DIR = Path(os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}") / "protonhax"
+
 CACHE_DIR = Path.home() / ".cache" / "ce-autostart"
-CACHE_FILE = CACHE_DIR / "steam_apps.json"
+CACHE_DB_FILE = CACHE_DIR / "steam_apps.db"
 CACHE_METADATA_FILE = CACHE_DIR / "cache_metadata.json"
+CACHE_DOWNLOAD_FILE = CACHE_DIR / "steam_apps.json.part"
+# JSON app list cache written by older versions, removed after the first refresh
+LEGACY_CACHE_FILE = CACHE_DIR / "steam_apps.json"
+CONFIG_PICKLE_FILE = CACHE_DIR / "config.pickle"
+CACHE_MISSES_FILE = CACHE_DIR / "lookup_misses.json"
+CACHE_REFRESH_LOCK_FILE = CACHE_DIR / "refresh.lock"
 STEAM_API_URL = "https://api.steampowered.com/ISteamApps/GetAppList/v1/"
 CACHE_VALIDITY_DAYS = 7
+# A stale cache younger than this is still used while it refreshes in the background
+CACHE_MAX_STALE_DAYS = 30
+# Bump when the layout of the cached app database changes
+CACHE_SCHEMA_VERSION = 1
+LOOKUP_MISS_TTL_SECONDS = 24 * 60 * 60
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+MANIFEST_HEADER_SIZE = 4096
+
 
+def _load_toml(config_path: Path) -> dict:
+    """
+    Parse a TOML config file, reusing a pickled copy of the previous parse
+    while the file is unchanged (same path, mtime and size).
+    """
+    st = config_path.stat()
+    key = (str(config_path), st.st_mtime_ns, st.st_size)
+
+    try:
+        cached_key, cached_config = pickle.loads(CONFIG_PICKLE_FILE.read_bytes())
+        if cached_key == key:
+            return cached_config
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
 
+    with open(config_path, "rb") as f:
+        config = tomllib.load(f)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _write_atomic(CONFIG_PICKLE_FILE, pickle.dumps((key, config), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+    return config
+
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
     """Load configuration from TOML file."""
+    # A single directory listing answers both current-directory candidates
+    cwd = Path.cwd()
+    try:
+        with os.scandir(cwd) as entries:
+            cwd_names = {entry.name for entry in entries}
+    except OSError:
+        cwd_names = set()
+
     for config_path in CONFIG_PATHS:
-        if config_path.exists():
+        if config_path.parent == cwd:
+            found = config_path.name in cwd_names
+        else:
+            found = config_path.exists()
+
+        if found:
             print(f"Loading config from: {config_path}")
-            with open(config_path, "rb") as f:
-                return tomllib.load(f)
+            return _load_toml(config_path)
 
     print("Error: No config file found. Checked:", file=sys.stderr)
     for path in CONFIG_PATHS:
@@ -78,6 +217,9 @@ def is_app_excluded(app_id: str, app_name: str, patterns: list[str] | None = Non
             _EXCLUDED_PATTERNS_CACHE[cache_key] = [re.compile(p, re.IGNORECASE) for p in patterns]
         except re.error as e:
             print(f"Warning: Invalid regex pattern: {e}", file=sys.stderr)
+            # Remember the failure so the patterns are not recompiled (and
+            # the warning not repeated) for every app
+            _EXCLUDED_PATTERNS_CACHE[cache_key] = []
             return False
 
     compiled_patterns = _EXCLUDED_PATTERNS_CACHE[cache_key]
@@ -90,23 +232,53 @@ def is_app_excluded(app_id: str, app_name: str, patterns: list[str] | None = Non
     return False
 
 
-def get_running_game_uid() -> str:
-    """Run 'protonhax ls' and parse the uid of the running game."""
+def _list_protonhax_games() -> str | None:
+    """
+    List the games registered in the protonhax runtime directory, sorted
+    like 'protonhax ls' prints them.
+    Returns None if the directory cannot be read.
+    """
+    try:
+        with os.scandir(PROTONHAX_RUN_DIR) as entries:
+            return "\n".join(sorted(entry.name for entry in entries))
+    except OSError:
+        return None
+
+
+def _run_protonhax_ls() -> str:
+    """Run 'protonhax ls' and return its output."""
+    # Resolving the absolute path and keeping close_fds off lets CPython
+    # start the child with posix_spawn instead of fork+exec
+    protonhax = shutil.which("protonhax")
+    if protonhax is None:
+        print("Error: 'protonhax' command not found. Is protonhax installed?", file=sys.stderr)
+        sys.exit(1)
+
     try:
         result = subprocess.run(
-            ["protonhax", "ls"],
+            [protonhax, "ls"],
             capture_output=True,
-            text=True,
             check=True,
+            close_fds=False,
         )
     except FileNotFoundError:
         print("Error: 'protonhax' command not found. Is protonhax installed?", file=sys.stderr)
         sys.exit(1)
     except subprocess.CalledProcessError as e:
-        print(f"Error running 'protonhax ls': {e.stderr}", file=sys.stderr)
+        print(f"Error running 'protonhax ls': {e.stderr.decode(errors='replace')}", file=sys.stderr)
         sys.exit(1)
 
-    output = result.stdout.strip()
+    return result.stdout.decode(errors="replace")
+
+
+def get_running_game_uid() -> str:
+    """Get the uid of the running game as listed by 'protonhax ls'."""
+    # 'protonhax ls' only lists its runtime directory, so read that directly
+    # and run the command only when the directory is not where we expect it
+    output = _list_protonhax_games()
+    if output is None:
+        output = _run_protonhax_ls()
+    output = output.strip()
 
     if not output:
         print("Error: No running game found.", file=sys.stderr)
@@ -122,64 +294,231 @@ def get_running_game_uid() -> str:
     return uid
 
 
-def is_cache_valid() -> bool:
-    """Check if the cached Steam app list is still valid."""
-    if not CACHE_METADATA_FILE.exists():
+def is_cache_valid(max_age_days: int = CACHE_VALIDITY_DAYS) -> bool:
+    """
+    Check if the cached Steam app list is still valid, based on its modification time.
+    max_age_days can be raised to check whether a stale cache is still usable.
+    """
+    try:
+        age = time.time() - os.stat(CACHE_DB_FILE).st_mtime
+    except OSError:
         return False
 
-    try:
-        with open(CACHE_METADATA_FILE, "r") as f:
-            metadata = json.load(f)
+    return age < max_age_days * 86400
 
-        last_update = datetime.fromisoformat(metadata.get("last_update", ""))
-        age = datetime.now() - last_update
 
-        return age < timedelta(days=CACHE_VALIDITY_DAYS)
-    except (json.JSONDecodeError, ValueError, KeyError):
-        return False
+def _dump_json(data: dict) -> bytes:
+    """Serialize cache data as compact UTF-8 JSON bytes."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a temporary file and an atomic rename."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
-def update_steam_app_cache() -> bool:
-    """Fetch and cache the Steam app list from the official API."""
+
+def _app_entry_pair(obj: dict) -> dict | tuple:
+    """
+    JSON object hook that collapses each {"appid", "name"} app entry into an
+    (appid, name) tuple while decoding, so the full list of per-app dicts is
+    never held in memory.
+    """
+    if "appid" in obj:
+        return obj["appid"], obj.get("name")
+    return obj
+
+
+def load_cache_metadata() -> dict:
+    """Load the Steam cache metadata, or an empty dict if it is missing or unreadable."""
     try:
-        print("Updating Steam app list cache...")
-        response = requests.get(STEAM_API_URL, timeout=30)
-        response.raise_for_status()
+        return json.loads(CACHE_METADATA_FILE.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return {}
 
-        data = response.json()
 
+@functools.lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for Steam API requests.
+    Reusing one session keeps the connection alive between requests and sends
+    the compression encodings urllib3 can decode (gzip, deflate, and br/zstd
+    when their decoders are installed).
+    """
+    return requests.Session()
+
+
+def update_steam_app_cache(wait: bool = True) -> bool:
+    """
+    Fetch and cache the Steam app list from the official API.
+    Refreshes share the download and temporary database paths, so they are
+    serialized with a lock file. With wait=False the refresh is skipped if
+    another one is already running.
+    """
+    try:
         # Ensure cache directory exists
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        lock_fd = os.open(CACHE_REFRESH_LOCK_FILE, os.O_WRONLY | os.O_CREAT, 0o644)
+    except OSError as e:
+        print(f"Warning: Failed to update Steam app cache: {e}", file=sys.stderr)
+        return False
+
+    try:
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return _fetch_steam_app_cache()
+    finally:
+        # Closing the file releases the lock
+        os.close(lock_fd)
+
+
+def _fetch_steam_app_cache() -> bool:
+    """Download the Steam app list and rebuild the cache, holding the refresh lock."""
+    try:
+        print("Updating Steam app list cache...")
 
-        # Save the app list
-        with open(CACHE_FILE, "w") as f:
-            json.dump(data, f)
+        # Make the request conditional on the validators of the cached copy,
+        # so an unchanged app list costs a 304 instead of a full download
+        metadata = load_cache_metadata() if CACHE_DB_FILE.exists() else {}
+        if metadata.get("schema_version") != CACHE_SCHEMA_VERSION:
+            metadata = {}
+        headers = {}
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+
+        # Stream the body to disk in large chunks instead of buffering the
+        # whole response in memory
+        with get_http_session().get(STEAM_API_URL, headers=headers, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            if response.status_code == 304:
+                # Unchanged upstream: keep the cached list and restart its validity window
+                os.utime(CACHE_DB_FILE)
+                metadata["last_update"] = datetime.now().isoformat()
+                _write_atomic(CACHE_METADATA_FILE, _dump_json(metadata))
+                print("✓ Cache is up to date")
+                return True
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            with open(CACHE_DOWNLOAD_FILE, "wb", buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+        try:
+            with open(CACHE_DOWNLOAD_FILE, "rb") as f:
+                data = json.load(f, object_hook=_app_entry_pair)
+        finally:
+            CACHE_DOWNLOAD_FILE.unlink(missing_ok=True)
+
+        apps = data["applist"]["apps"]["app"]
+
+        # Store the app list as an appid-keyed table so a lookup is a single
+        # primary-key probe instead of parsing the whole list. The database is
+        # built beside the live one and swapped in atomically, so an
+        # interrupted refresh never leaves a half-written cache behind.
+        tmp_db_file = CACHE_DB_FILE.with_name(CACHE_DB_FILE.name + ".tmp")
+        tmp_db_file.unlink(missing_ok=True)
+        con = sqlite3.connect(tmp_db_file)
+        try:
+            with con:
+                con.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+                con.execute("CREATE TABLE apps (appid INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+                con.executemany(
+                    "INSERT OR REPLACE INTO apps (appid, name) VALUES (?, ?)",
+                    # Skip malformed entries: objects without an appid stay dicts
+                    (
+                        entry for entry in apps
+                        if isinstance(entry, tuple) and isinstance(entry[0], int) and entry[1]
+                    ),
+                )
+            app_count = con.execute("SELECT COUNT(*) FROM apps").fetchone()[0]
+        finally:
+            con.close()
+
+        # Drop any connection opened before the refresh
+        open_app_cache.cache_clear()
+        os.replace(tmp_db_file, CACHE_DB_FILE)
+        LEGACY_CACHE_FILE.unlink(missing_ok=True)
 
         # Save metadata
         metadata = {
             "last_update": datetime.now().isoformat(),
-            "app_count": len(data.get("applist", {}).get("apps", {}).get("app", [])),
+            "app_count": app_count,
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "etag": etag,
+            "last_modified": last_modified,
         }
-        with open(CACHE_METADATA_FILE, "w") as f:
-            json.dump(metadata, f)
+        _write_atomic(CACHE_METADATA_FILE, _dump_json(metadata))
+
+        # Apps missing from the old list may be in the new one
+        CACHE_MISSES_FILE.unlink(missing_ok=True)
 
         print(f"✓ Cache updated with {metadata['app_count']} apps")
         return True
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError, KeyError, TypeError, sqlite3.Error, OSError) as e:
         print(f"Warning: Failed to update Steam app cache: {e}", file=sys.stderr)
         return False
 
 
-def load_app_cache() -> dict | None:
-    """Load the cached Steam app list."""
-    if not CACHE_FILE.exists():
+def refresh_app_cache_in_background() -> None:
+    """
+    Refresh the Steam app cache in a detached process so the caller never
+    waits on the network. Unlike a thread, the process outlives the exec
+    that launches CheatEngine. Its output is discarded, and it gives up if
+    another refresh is already running.
+    Call this before open_app_cache(): an SQLite connection must not be
+    used (or closed) in a process forked after it was opened.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        pid = os.fork()
+    except OSError:
+        return
+
+    if pid:
+        # Reap the intermediate child; the grandchild is adopted by init
+        os.waitpid(pid, 0)
+        return
+
+    try:
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+
+        update_steam_app_cache(wait=False)
+    finally:
+        os._exit(0)
+
+
+@functools.lru_cache(maxsize=1)
+def open_app_cache() -> sqlite3.Connection | None:
+    """
+    Open the cached Steam app database read-only.
+    Returns None if there is no cache or it was written with another schema
+    version. The connection is memoized for the lifetime of the process.
+    """
+    if not CACHE_DB_FILE.exists():
         return None
 
     try:
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+        con = sqlite3.connect(f"{CACHE_DB_FILE.as_uri()}?mode=ro", uri=True)
+        if con.execute("PRAGMA user_version").fetchone()[0] != CACHE_SCHEMA_VERSION:
+            con.close()
+            return None
+        return con
+    except sqlite3.Error:
         return None
 
 
@@ -191,31 +530,113 @@ def lookup_game_from_manifest(app_id: str, steam_path: str) -> str | None:
     steam_dir = Path(steam_path).expanduser()
     manifest_file = steam_dir / f"appmanifest_{app_id}.acf"
 
-    if not manifest_file.exists():
+    # Open directly instead of probing with exists() first: one syscall
+    # on the hot path, and a missing manifest is simply a miss
+    try:
+        fd = os.open(manifest_file, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"Warning: Could not read manifest file {manifest_file}: {e}", file=sys.stderr)
         return None
 
     try:
-        with open(manifest_file, "r") as f:
-            content = f.read()
-
-        # Parse the manifest file (it's a simple key-value format)
-        # Looking for the "name" field which contains the game title
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith('"name"'):
-                # Extract the value between quotes
-                # Format: "name"		"Game Title"
-                parts = line.split('"', 3)
-                if len(parts) >= 4:
-                    # Remove the trailing quote if present
-                    game_title = parts[3].rstrip('"')
-                    return game_title
+        # "name" sits near the top of the manifest, so a single small read
+        # almost always finds it
+        header = os.read(fd, MANIFEST_HEADER_SIZE)
+        match = _MANIFEST_NAME_RE.search(header)
+        if match:
+            return match.group(1).decode("utf-8", errors="replace")
+
+        if len(header) == MANIFEST_HEADER_SIZE:
+            # Fall back to searching the mapped file without copying it
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as content:
+                match = _MANIFEST_NAME_RE.search(content)
+                if match:
+                    return match.group(1).decode("utf-8", errors="replace")
 
         return None
 
-    except (IOError, OSError) as e:
+    except OSError as e:
         print(f"Warning: Could not read manifest file {manifest_file}: {e}", file=sys.stderr)
         return None
+    finally:
+        os.close(fd)
+
+
+def _load_lookup_misses() -> dict:
+    """Load the {app_id: timestamp} record of recent Steam API cache misses."""
+    try:
+        return json.loads(CACHE_MISSES_FILE.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _record_lookup_miss(app_id: str) -> None:
+    """Remember that an app ID was not in the Steam API cache, dropping expired entries."""
+    now = time.time()
+    misses = {
+        missed_id: missed_at
+        for missed_id, missed_at in _load_lookup_misses().items()
+        if now - missed_at < LOOKUP_MISS_TTL_SECONDS
+    }
+    misses[app_id] = now
+
+    try:
+        _write_atomic(CACHE_MISSES_FILE, _dump_json(misses))
+    except OSError:
+        pass
+
+
+def get_library_steamapps_dirs(steam_path: str) -> list[Path]:
+    """
+    Get the steamapps directories of all Steam library folders.
+    Accepts either the Steam installation directory or its steamapps directory
+    and reads the additional libraries from steamapps/libraryfolders.vdf.
+    """
+    steam_dir = Path(steam_path).expanduser()
+    primary = steam_dir if steam_dir.name == "steamapps" else steam_dir / "steamapps"
+    steamapps_dirs = [primary]
+
+    try:
+        libraries = read_vdf(primary / "libraryfolders.vdf").get("libraryfolders", {})
+    except (IOError, OSError):
+        return steamapps_dirs
+
+    for library in libraries.values():
+        if isinstance(library, dict) and library.get("path"):
+            steamapps_dir = Path(library["path"]) / "steamapps"
+            if steamapps_dir not in steamapps_dirs:
+                steamapps_dirs.append(steamapps_dir)
+
+    return steamapps_dirs
+
+
+def lookup_game_from_libraries(app_id: str, steam_path: str) -> str | None:
+    """
+    Look up the game title from the manifests of all Steam library folders.
+    Libraries (often on different disks) are searched concurrently and the
+    first hit is returned without waiting for the slower libraries.
+    """
+    steamapps_dirs = get_library_steamapps_dirs(steam_path)
+    if len(steamapps_dirs) == 1:
+        return lookup_game_from_manifest(app_id, str(steamapps_dirs[0]))
+
+    # Not a with block: its exit would wait for every search to finish
+    pool = ThreadPoolExecutor(max_workers=len(steamapps_dirs))
+    try:
+        futures = [
+            pool.submit(lookup_game_from_manifest, app_id, str(steamapps_dir))
+            for steamapps_dir in steamapps_dirs
+        ]
+        for future in as_completed(futures):
+            game_title = future.result()
+            if game_title:
+                return game_title
+
+        return None
+    finally:
+        pool.shutdown(wait=False)
 
 
 def lookup_game_title(app_id: str, steam_path: str | None = None) -> str | None:
@@ -224,52 +645,67 @@ def lookup_game_title(app_id: str, steam_path: str | None = None) -> str | None:
 
     Args:
         app_id: The Steam application ID
-        steam_path: Path to Steam steamapps directory (if None, skips local lookup)
+        steam_path: Path to Steam (or its steamapps) directory (if None, skips local lookup)
 
     Returns:
         Game title if found, None otherwise
     """
-    # First, try to lookup from local Steam manifest
+    # First, try to lookup from local Steam manifests
     if steam_path:
         print(f"Looking up game title from local Steam manifest...")
-        game_title = lookup_game_from_manifest(app_id, steam_path)
+        game_title = lookup_game_from_libraries(app_id, steam_path)
         if game_title:
             print(f"✓ Found game in local manifest: {game_title}")
             return game_title
         else:
             print(f"Game not found in local Steam folder")
 
+    # Skip the Steam API cache for an app ID that recently wasn't in it
+    if time.time() - _load_lookup_misses().get(app_id, 0) < LOOKUP_MISS_TTL_SECONDS:
+        print(f"Warning: App ID {app_id} was recently not found in Steam database, skipping lookup", file=sys.stderr)
+        return None
+
     # Fall back to Steam API cache
     print(f"Looking up game title from Steam API cache...")
 
-    # Check if cache needs update
-    if not is_cache_valid():
+    # Open cache, refreshing it first only if it is missing, too old to use
+    # or from an older schema. A merely stale cache is used right away and
+    # refreshed in the background.
+    if is_cache_valid():
+        con = open_app_cache()
+    elif is_cache_valid(CACHE_MAX_STALE_DAYS):
+        # Fork the refresh before the cache is opened in this process
+        print("Steam app list cache is stale, refreshing it in the background")
+        refresh_app_cache_in_background()
+        con = open_app_cache()
+    else:
+        con = None
+
+    if con is None:
         update_steam_app_cache()
+        con = open_app_cache()
 
-    # Load cache
-    data = load_app_cache()
-    if not data:
+    if con is None:
         print("Warning: No cached Steam app list available", file=sys.stderr)
         return None
 
-    # Search for the app
+    # Look up the app by its primary key
     try:
-        app_id_int = int(app_id)
-        for app in data.get("applist", {}).get("apps", {}).get("app", []):
-            if app.get("appid") == app_id_int:
-                game_title = app.get("name")
-                if game_title:
-                    print(f"✓ Found game in Steam API cache: {game_title}")
-                    return game_title
-    except (ValueError, KeyError):
+        row = con.execute("SELECT name FROM apps WHERE appid = ?", (int(app_id),)).fetchone()
+        if row:
+            game_title = row[0]
+            print(f"✓ Found game in Steam API cache: {game_title}")
+            return game_title
+    except (ValueError, sqlite3.Error):
         pass
 
+    _record_lookup_miss(app_id)
     print(f"Warning: Could not find game with app ID {app_id} in Steam database", file=sys.stderr)
     return None
 
 
 def launch_cheatengine(uid: str, executable_path: str) -> None:
-    """Launch CheatEngine using protonhax run."""
+    """Launch CheatEngine by replacing this process with protonhax run."""
     exe_path = Path(executable_path).expanduser()
 
     if not exe_path.exists():
@@ -279,19 +715,24 @@ def launch_cheatengine(uid: str, executable_path: str) -> None:
     print(f"Launching CheatEngine for game uid: {uid}")
     print(f"Using executable: {exe_path}")
 
+    # Nothing runs after the launch, so replace this process with protonhax
+    # instead of keeping the interpreter alive as its parent
+    sys.stdout.flush()
+    sys.stderr.flush()
     try:
-        subprocess.run(
-            ["protonhax", "run", uid, str(exe_path)],
-            check=False,  # Don't fail if protonhax returns non-zero
-        )
+        os.execvp("protonhax", ["protonhax", "run", uid, str(exe_path)])
     except FileNotFoundError:
         print("Error: 'protonhax' command not found.", file=sys.stderr)
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=4)
 def find_localconfig_vdf(steam_path: str | None = None) -> Path | None:
     """
-    Find the localconfig.vdf file by recursively searching userdata subdirectories.
+    Find the localconfig.vdf file in the Steam userdata directory.
+    Checks the standard userdata/<user_id>/config/localconfig.vdf location
+    first and only searches the whole tree recursively if that fails.
+    The result is memoized per steam_path.
     Returns the path to localconfig.vdf if found, None otherwise.
     """
     if steam_path is None:
@@ -300,10 +741,19 @@ def find_localconfig_vdf(steam_path: str | None = None) -> Path | None:
     steam_dir = Path(steam_path).expanduser()
     userdata_dir = steam_dir / "userdata"
 
-    if not userdata_dir.exists():
+    try:
+        with os.scandir(userdata_dir) as entries:
+            user_dirs = [entry.path for entry in entries if entry.is_dir()]
+    except OSError:
         print(f"Warning: Steam userdata directory not found: {userdata_dir}", file=sys.stderr)
         return None
 
+    # Check the standard location of each user first
+    for user_dir in user_dirs:
+        localconfig = Path(user_dir) / "config" / "localconfig.vdf"
+        if localconfig.is_file():
+            return localconfig
+
     # Recursively search for localconfig.vdf
     for localconfig in userdata_dir.rglob("localconfig.vdf"):
         return localconfig
@@ -312,139 +762,185 @@ def find_localconfig_vdf(steam_path: str | None = None) -> Path | None:
     return None
 
 
-def parse_vdf(content: str) -> dict:
+def parse_vdf(content: str | bytes | mmap.mmap) -> dict:
     """
     Parse VDF format file content into a Python dictionary.
     VDF format uses quoted keys and values with nested braces.
+    Raw bytes (or a mapped file) are scanned as-is and only the quoted
+    strings are decoded.
     """
-    def tokenize(text):
-        """Tokenize VDF content."""
-        tokens = []
-        i = 0
-        while i < len(text):
-            # Skip whitespace
-            if text[i].isspace():
-                i += 1
-                continue
-            # Handle comments
-            if text[i:i+2] == '//':
-                while i < len(text) and text[i] != '\n':
-                    i += 1
-                continue
-            # Handle quoted strings
-            if text[i] == '"':
-                i += 1
-                start = i
-                while i < len(text) and text[i] != '"':
-                    i += 1
-                tokens.append(('STRING', text[start:i]))
-                i += 1
-            # Handle braces and tabs
-            elif text[i] in '{}':
-                tokens.append(('BRACE', text[i]))
-                i += 1
-            else:
-                i += 1
-        return tokens
+    # Tokens are consumed straight from the regex scan, without building an
+    # intermediate token list. Group 1 is a quoted string, group 2 a brace;
+    # comments match neither and are dropped here.
+    if isinstance(content, str):
+        matches = _VDF_TOKEN_RE.finditer(content)
+        open_brace = "{"
+
+        def string_value(match):
+            return match.group(1)
+    else:
+        matches = _VDF_TOKEN_BYTES_RE.finditer(content)
+        open_brace = b"{"
 
-    def parse_tokens(tokens, index=0):
-        """Recursively parse tokens into a dictionary."""
-        result = {}
-        while index < len(tokens):
-            token_type, token_value = tokens[index]
+        def string_value(match):
+            return match.group(1).decode("utf-8", errors="replace")
+    tokens = (match for match in matches if match.lastindex)
+
+    # A closing brace seen while looking for a value is handed back to the
+    # enclosing section, which then ends on it as well
+    pushed_back = []
 
-            if token_type == 'STRING':
-                key = token_value
-                index += 1
+    def next_token():
+        if pushed_back:
+            return pushed_back.pop()
+        return next(tokens, None)
+
+    def parse_section():
+        """Recursively parse tokens into a dictionary until the closing brace."""
+        result = {}
+        while (token := next_token()) is not None:
+            if token.lastindex == 1:
+                key = string_value(token)
 
                 # Skip tabs
-                while index < len(tokens) and tokens[index][0] == 'STRING' and tokens[index][1] == '':
-                    index += 1
-
-                if index < len(tokens):
-                    next_type, next_value = tokens[index]
-
-                    if next_type == 'BRACE' and next_value == '{':
-                        # Nested dict
-                        index += 1
-                        nested, index = parse_tokens(tokens, index)
-                        result[key] = nested
-                    elif next_type == 'STRING':
-                        # Key-value pair
-                        result[key] = next_value
-                        index += 1
-                    elif next_type == 'BRACE' and next_value == '}':
-                        break
-            elif token_type == 'BRACE' and token_value == '}':
-                index += 1
+                value = next_token()
+                while value is not None and value.lastindex == 1 and not value.group(1):
+                    value = next_token()
+
+                if value is None:
+                    break
+                elif value.lastindex == 1:
+                    # Key-value pair
+                    result[key] = string_value(value)
+                elif value.group(2) == open_brace:
+                    # Nested dict
+                    result[key] = parse_section()
+                else:
+                    pushed_back.append(value)
+                    break
+            elif token.group(2) != open_brace:
                 break
-            else:
-                index += 1
 
-        return result, index
+        return result
 
-    tokens = tokenize(content)
-    parsed, _ = parse_tokens(tokens)
-    return parsed
+    return parse_section()
 
 
-def write_vdf(data: dict, indent: int = 0) -> str:
+def read_vdf(path: Path) -> dict:
     """
-    Write a dictionary back to VDF format.
+    Read and parse a VDF file.
+    The file is memory-mapped and tokenized as bytes, so a multi-MB
+    localconfig.vdf is never decoded into one large string.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return parse_vdf(content)
+
+
+@functools.lru_cache(maxsize=2)
+def _read_localconfig(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse a VDF file, memoized on its path, mtime and size."""
+    return read_vdf(Path(path_str))
+
+
+def read_localconfig(localconfig_path: Path) -> dict:
+    """
+    Read and parse localconfig.vdf for lookups only, reusing the previous
+    parse while the file is unchanged. Writes change the file's mtime, which
+    invalidates the cached copy automatically.
+    The returned data is shared: callers must not modify it.
     """
-    lines = []
+    st = os.stat(localconfig_path)
+    return _read_localconfig(str(localconfig_path), st.st_mtime_ns, st.st_size)
+
+
+def _write_vdf_into(data: dict, indent: int, out: list[str]) -> None:
+    """Append the VDF lines for data to out, recursing into nested dicts."""
     indent_str = "\t" * indent
 
     for key, value in data.items():
         if isinstance(value, dict):
-            lines.append(f'{indent_str}"{key}"')
-            lines.append(f'{indent_str}{{')
-            lines.append(write_vdf(value, indent + 1).rstrip())
-            lines.append(f'{indent_str}}}')
+            out.append(f'{indent_str}"{key}"\n{indent_str}{{\n')
+            _write_vdf_into(value, indent + 1, out)
+            out.append(f'{indent_str}}}\n')
         else:
-            lines.append(f'{indent_str}"{key}"\t\t"{value}"')
+            out.append(f'{indent_str}"{key}"\t\t"{value}"\n')
 
-    return '\n'.join(lines) + '\n'
+
+def write_vdf(data: dict) -> str:
+    """
+    Write a dictionary back to VDF format.
+    All lines are collected in one buffer and joined once.
+    """
+    out = []
+    _write_vdf_into(data, 0, out)
+    return "".join(out)
 
 
-def get_installed_games(steam_path: str | None = None, excluded_patterns: list[str] | None = None) -> tuple[list[str], list[str]]:
+def get_installed_games(
+    steam_path: str | None = None,
+    excluded_patterns: list[str] | None = None,
+    game_infos: dict | None = None
+) -> tuple[list[str], list[str]]:
     """
     Get list of installed game IDs by reading appmanifest_*.acf files.
+    The manifests are read concurrently, and only when their names are
+    needed for exclusion or by the caller.
 
     Args:
         steam_path: Path to steamapps directory
         excluded_patterns: List of regex patterns for apps to exclude
+        game_infos: Optional dict that receives the get_game_info result of
+            every installed game, keyed by app ID, so callers can reuse it
 
     Returns:
-        Tuple of (included_app_ids, excluded_app_ids) as sorted lists of strings.
+        Tuple of (included_app_ids, excluded_app_ids) as lists of strings in numeric order.
     """
     if steam_path is None:
         steam_path = "~/.local/share/Steam/steamapps"
 
     steamapps_dir = Path(steam_path).expanduser()
 
-    if not steamapps_dir.exists():
+    # Match manifest file names against one precompiled pattern in a single
+    # directory listing instead of globbing into Path objects
+    try:
+        with os.scandir(steamapps_dir) as entries:
+            app_ids = [
+                match.group(1)
+                for entry in entries
+                if (match := _MANIFEST_FILE_RE.fullmatch(entry.name))
+            ]
+    except OSError:
         print(f"Warning: Steam steamapps directory not found: {steamapps_dir}", file=sys.stderr)
         return [], []
 
+    app_ids.sort(key=int)
+    if not excluded_patterns and game_infos is None:
+        return app_ids, []
+
+    # Read the manifests concurrently; the work is bound by file I/O latency
+    if game_infos is None:
+        game_infos = {}
+    if app_ids:
+        with ThreadPoolExecutor(max_workers=min(32, len(app_ids))) as pool:
+            game_infos.update(zip(app_ids, pool.map(lambda app_id: get_game_info(app_id, steam_path), app_ids)))
+
     included_apps = []
     excluded_apps = []
 
-    for manifest_file in steamapps_dir.glob("appmanifest_*.acf"):
-        # Extract ID from filename
-        app_id = manifest_file.stem.replace("appmanifest_", "")
-        if app_id.isdigit():
-            # Get game name to check exclusion
-            game_info = get_game_info(app_id, steam_path)
-            game_name = game_info.get("name", f"Game {app_id}")
-
-            # Check if excluded
-            if is_app_excluded(app_id, game_name, excluded_patterns):
-                excluded_apps.append(app_id)
-            else:
-                included_apps.append(app_id)
+    for app_id in app_ids:
+        # Get game name to check exclusion
+        game_name = game_infos[app_id].get("name", f"Game {app_id}")
 
-    return sorted(included_apps), sorted(excluded_apps)
+        # Check if excluded
+        if is_app_excluded(app_id, game_name, excluded_patterns):
+            excluded_apps.append(app_id)
+        else:
+            included_apps.append(app_id)
+
+    return included_apps, excluded_apps
 
 
 def get_game_info(app_id: str, steam_path: str | None = None) -> dict:
@@ -469,27 +965,19 @@ def get_game_info(app_id: str, steam_path: str | None = None) -> dict:
         return game_info
 
     try:
-        with open(manifest_file, "r") as f:
+        with open(manifest_file, "rb") as f:
             content = f.read()
 
-        # Parse the manifest file for game metadata
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith('"name"'):
-                # Extract game name: "name"		"Game Title"
-                parts = line.split('"', 3)
-                if len(parts) >= 4:
-                    game_info["name"] = parts[3].rstrip('"')
-            elif line.startswith('"executable"'):
-                # Extract executable path
-                parts = line.split('"', 3)
-                if len(parts) >= 4:
-                    game_info["executable"] = parts[3].rstrip('"')
-            elif line.startswith('"installdir"'):
-                # Extract install directory
-                parts = line.split('"', 3)
-                if len(parts) >= 4:
-                    game_info["install_dir"] = parts[3].rstrip('"')
+        # Collect all fields in one pass over the raw bytes, stopping as soon
+        # as each has been seen once
+        found = {}
+        for match in _MANIFEST_FIELDS_RE.finditer(content):
+            found.setdefault(match.group(1), match.group(2))
+            if len(found) == len(_MANIFEST_FIELD_KEYS):
+                break
+
+        for key, value in found.items():
+            game_info[_MANIFEST_FIELD_KEYS[key]] = value.decode("utf-8", errors="replace")
 
         return game_info
 
@@ -498,45 +986,79 @@ def get_game_info(app_id: str, steam_path: str | None = None) -> dict:
         return game_info
 
 
-def get_launchoption_status(app_id: str, steam_path: str | None = None) -> str:
+def get_apps_section(localconfig_data: dict) -> dict:
     """
-    Check the LaunchOption status for a game.
+    Get the per-app section (Software -> Valve -> Steam -> apps) of parsed
+    localconfig.vdf data, or an empty dict if it is missing.
+    """
+    try:
+        return localconfig_data["Software"]["Valve"]["Steam"]["apps"]
+    except (KeyError, TypeError):
+        return {}
+
+
+def _collect_apps_section(localconfig_path: Path) -> dict:
+    """
+    Parse localconfig.vdf and return its per-app section.
+    Read once and shared when the status of many games is needed.
+    """
+    return get_apps_section(read_localconfig(localconfig_path))
+
+
+def _status_from_apps(apps: dict, app_id: str) -> str:
+    """
+    Get the LaunchOption status of a game from an already parsed apps section.
     Returns one of: "Configured", "Not Set", or "Error"
     """
+    try:
+        if app_id in apps and isinstance(apps[app_id], dict):
+            if "LaunchOptions" in apps[app_id]:
+                return "Configured"
+            else:
+                return "Not Set"
+        else:
+            return "Not Set"
+
+    except (KeyError, TypeError, AttributeError):
+        return "Error"
+
+
+def get_all_launchoption_statuses(steam_path: str | None = None) -> dict[str, str] | None:
+    """
+    Get the LaunchOption status of every app in localconfig.vdf with a single parse.
+    Apps missing from the result are "Not Set".
+    Returns None if localconfig.vdf could not be read.
+    """
     if steam_path is None:
         steam_path = "~/.local/share/Steam"
 
     try:
         localconfig_path = find_localconfig_vdf(steam_path)
         if not localconfig_path:
-            return "Error"
+            return None
 
-        with open(localconfig_path, "r") as f:
-            content = f.read()
+        apps = _collect_apps_section(localconfig_path)
+        return {app_id: _status_from_apps(apps, app_id) for app_id in apps}
 
-        localconfig_data = parse_vdf(content)
+    except Exception:
+        return None
 
-        # Navigate to the app section
-        try:
-            apps = (
-                localconfig_data
-                .get("Software", {})
-                .get("Valve", {})
-                .get("Steam", {})
-                .get("apps", {})
-            )
 
-            if app_id in apps and isinstance(apps[app_id], dict):
-                if "LaunchOptions" in apps[app_id]:
-                    return "Configured"
-                else:
-                    return "Not Set"
-            else:
-                return "Not Set"
+def get_launchoption_status(app_id: str, steam_path: str | None = None) -> str:
+    """
+    Check the LaunchOption status for a game.
+    Returns one of: "Configured", "Not Set", or "Error"
+    """
+    if steam_path is None:
+        steam_path = "~/.local/share/Steam"
 
-        except (KeyError, TypeError, AttributeError):
+    try:
+        localconfig_path = find_localconfig_vdf(steam_path)
+        if not localconfig_path:
             return "Error"
 
+        return _status_from_apps(_collect_apps_section(localconfig_path), app_id)
+
     except Exception:
         return "Error"
 
@@ -547,10 +1069,7 @@ def get_game_title(app_id: str, localconfig_data: dict) -> str | None:
     """
     try:
         # Navigate the structure: Software -> Valve -> Steam -> apps -> <app_id>
-        software = localconfig_data.get("Software", {})
-        valve = software.get("Valve", {})
-        steam = valve.get("Steam", {})
-        apps = steam.get("apps", {})
+        apps = get_apps_section(localconfig_data)
 
         if app_id in apps:
             # Get the game entry
@@ -564,31 +1083,179 @@ def get_game_title(app_id: str, localconfig_data: dict) -> str | None:
     return None
 
 
-def create_backup(game_id: str, original_value: str) -> None:
+def write_backup(entries: list[tuple[str, str]]) -> None:
     """
-    Create a backup of the original LaunchOptions value.
+    Write backup rows of original LaunchOptions values in a single write.
     Backup file is stored with timestamp in the current directory.
     """
+    if not entries:
+        return
+
     backup_dir = Path.cwd()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_file = backup_dir / f"launch_options_backup_{timestamp}.md"
 
-    # Append to backup file if it exists, create if not
-    backup_content = f"| {game_id} | {original_value} |\n"
+    backup_content = "".join(f"| {game_id} | {original_value} |\n" for game_id, original_value in entries)
+
+    # Append to the backup file, writing the header only when it starts out empty
+    with open(backup_file, "a") as f:
+        if f.tell() == 0:
+            backup_content = (
+                "# Launch Options Backup\n\n"
+                f"Generated: {datetime.now().isoformat()}\n\n"
+                "| Game ID | Original LaunchOptions |\n"
+                "|---------|------------------------|\n"
+                + backup_content
+            )
+        f.write(backup_content)
 
-    if backup_file.exists():
-        with open(backup_file, "a") as f:
-            f.write(backup_content)
+    if len(entries) == 1:
+        print(f"✓ Backed up original value to {backup_file}")
     else:
-        # Create with header
-        with open(backup_file, "w") as f:
-            f.write("# Launch Options Backup\n\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n\n")
-            f.write("| Game ID | Original LaunchOptions |\n")
-            f.write("|---------|------------------------|\n")
-            f.write(backup_content)
+        print(f"✓ Backed up {len(entries)} original values to {backup_file}")
 
-    print(f"✓ Backed up original value to {backup_file}")
+
+def create_backup(game_id: str, original_value: str) -> None:
+    """
+    Create a backup of the original LaunchOptions value.
+    Backup file is stored with timestamp in the current directory.
+    """
+    write_backup([(game_id, original_value)])
+
+
+def _confirm_replace(app_id: str, current_value: str, new_launch_options: str, ask_if_exists: bool) -> bool:
+    """
+    Decide whether an existing LaunchOptions value should be replaced,
+    asking the user first if ask_if_exists is set.
+    """
+    if current_value == new_launch_options:
+        print(f"ℹ Game {app_id}: LaunchOptions already set to {new_launch_options}")
+        return False
+
+    if ask_if_exists:
+        print(f"\n⚠ Game {app_id}:")
+        print(f"  Current value: {current_value}")
+        response = input(f"  Replace with '{new_launch_options}'? (y/n/skip): ").strip().lower()
+
+        if response == "skip" or response == "n":
+            print(f"  Skipped")
+            return False
+        elif response != "y":
+            print(f"  Invalid input, skipping")
+            return False
+
+    return True
+
+
+def _apply_modify(
+    localconfig_data: dict,
+    app_id: str,
+    new_launch_options: str,
+    ask_if_exists: bool,
+    backups: list[tuple[str, str]],
+) -> bool:
+    """
+    Set LaunchOptions for a game in parsed localconfig.vdf data.
+    Replaced values are appended to backups as (app_id, value) pairs.
+    Returns True if the data was changed, False otherwise.
+    """
+    # Navigate to the app section
+    # Structure: Software -> Valve -> Steam -> apps -> <app_id>
+    try:
+        apps = (
+            localconfig_data
+            .setdefault("Software", {})
+            .setdefault("Valve", {})
+            .setdefault("Steam", {})
+            .setdefault("apps", {})
+        )
+
+        app_section = apps.setdefault(app_id, {})
+    except (KeyError, TypeError, AttributeError):
+        print(f"Error: Could not navigate to app {app_id} in localconfig.vdf", file=sys.stderr)
+        return False
+
+    # Check if LaunchOptions already exists
+    if "LaunchOptions" in app_section:
+        current_value = app_section["LaunchOptions"]
+        if not _confirm_replace(app_id, current_value, new_launch_options, ask_if_exists):
+            return False
+
+        # Backup the original value
+        backups.append((app_id, current_value))
+
+    # Set the new LaunchOptions
+    app_section["LaunchOptions"] = new_launch_options
+    return True
+
+
+def _apply_remove(
+    localconfig_data: dict,
+    app_id: str,
+    ask_if_exists: bool,
+    backups: list[tuple[str, str]],
+) -> bool:
+    """
+    Remove LaunchOptions for a game from parsed localconfig.vdf data.
+    Removed values are appended to backups as (app_id, value) pairs.
+    Returns True if the data was changed, False otherwise.
+    """
+    # Navigate to the app section
+    # Structure: Software -> Valve -> Steam -> apps -> <app_id>
+    try:
+        apps = get_apps_section(localconfig_data)
+
+        if app_id not in apps:
+            print(f"ℹ Game {app_id}: Not found in localconfig.vdf")
+            return False
+
+        app_section = apps[app_id]
+
+        if not isinstance(app_section, dict):
+            print(f"ℹ Game {app_id}: Invalid app section structure")
+            return False
+
+    except (KeyError, TypeError, AttributeError):
+        print(f"Error: Could not navigate to app {app_id} in localconfig.vdf", file=sys.stderr)
+        return False
+
+    # Check if LaunchOptions exists
+    if "LaunchOptions" not in app_section:
+        print(f"ℹ Game {app_id}: No LaunchOptions to remove")
+        return False
+
+    current_value = app_section["LaunchOptions"]
+
+    if ask_if_exists:
+        print(f"\n⚠ Game {app_id}:")
+        print(f"  Current value: {current_value}")
+        response = input(f"  Remove LaunchOptions? (y/n/skip): ").strip().lower()
+
+        if response == "skip" or response == "n":
+            print(f"  Skipped")
+            return False
+        elif response != "y":
+            print(f"  Invalid input, skipping")
+            return False
+
+    # Backup the value being removed
+    backups.append((app_id, current_value))
+
+    # Remove the LaunchOptions
+    del app_section["LaunchOptions"]
+    return True
+
+
+def _find_launch_options(content: bytes) -> dict[str, list[re.Match]]:
+    """
+    Find the LaunchOptions values in raw localconfig.vdf content in a single
+    scan, grouped by app ID. Group 2 of each match spans the value between
+    its quotes.
+    """
+    found = {}
+    for match in _LAUNCH_OPTIONS_RE.finditer(content):
+        found.setdefault(match.group(1).decode(), []).append(match)
+    return found
 
 
 def modify_launch_options(
@@ -602,51 +1269,35 @@ def modify_launch_options(
     Returns True if modified, False otherwise.
     """
     try:
-        with open(localconfig_path, "r") as f:
-            content = f.read()
-
-        localconfig_data = parse_vdf(content)
-
-        # Navigate to the app section
-        # Structure: Software -> Valve -> Steam -> apps -> <app_id>
-        try:
-            apps = (
-                localconfig_data
-                .setdefault("Software", {})
-                .setdefault("Valve", {})
-                .setdefault("Steam", {})
-                .setdefault("apps", {})
-            )
+        # Replacing an existing value leaves the file's structure unchanged,
+        # so substitute it in place instead of re-parsing and re-writing the
+        # whole file. This also keeps the original formatting intact.
+        content = Path(localconfig_path).read_bytes()
+        matches = _find_launch_options(content).get(app_id, [])
+        if len(matches) == 1:
+            match = matches[0]
+            current_value = match.group(2).decode("utf-8", errors="replace")
+            if not _confirm_replace(app_id, current_value, new_launch_options, ask_if_exists):
+                return False
 
-            app_section = apps.setdefault(app_id, {})
-        except (KeyError, TypeError, AttributeError):
-            print(f"Error: Could not navigate to app {app_id} in localconfig.vdf", file=sys.stderr)
-            return False
+            create_backup(app_id, current_value)
 
-        # Check if LaunchOptions already exists
-        if "LaunchOptions" in app_section:
-            current_value = app_section["LaunchOptions"]
-            if current_value == new_launch_options:
-                print(f"ℹ Game {app_id}: LaunchOptions already set to {new_launch_options}")
-                return False
+            with open(localconfig_path, "wb") as f:
+                f.write(content[:match.start(2)])
+                f.write(new_launch_options.encode("utf-8"))
+                f.write(content[match.end(2):])
 
-            if ask_if_exists:
-                print(f"\n⚠ Game {app_id}:")
-                print(f"  Current value: {current_value}")
-                response = input(f"  Replace with '{new_launch_options}'? (y/n/skip): ").strip().lower()
+            print(f"✓ Modified game {app_id}: LaunchOptions set to '{new_launch_options}'")
+            return True
 
-                if response == "skip" or response == "n":
-                    print(f"  Skipped")
-                    return False
-                elif response != "y":
-                    print(f"  Invalid input, skipping")
-                    return False
+        # Adding the value for the first time (or an unusual layout): edit the parsed data
+        localconfig_data = read_vdf(localconfig_path)
 
-            # Backup the original value
-            create_backup(app_id, current_value)
+        backups = []
+        if not _apply_modify(localconfig_data, app_id, new_launch_options, ask_if_exists, backups):
+            return False
 
-        # Set the new LaunchOptions
-        app_section["LaunchOptions"] = new_launch_options
+        write_backup(backups)
 
         # Write back to file
         vdf_output = write_vdf(localconfig_data)
@@ -661,6 +1312,97 @@ def modify_launch_options(
         return False
 
 
+def modify_launch_options_batch(
+    app_ids: list[str],
+    new_launch_options: str,
+    localconfig_path: Path,
+    ask_if_exists: bool = True,
+    localconfig_data: dict | None = None
+) -> int:
+    """
+    Modify LaunchOptions for several games with a single read and write
+    of localconfig.vdf, and a single backup write. The file is only parsed
+    when some game has no LaunchOptions value to replace in place.
+    Already parsed localconfig_data can be passed in to skip the read.
+    Returns the number of games modified.
+    """
+    try:
+        if localconfig_data is None:
+            content = Path(localconfig_path).read_bytes()
+            found = _find_launch_options(content)
+            located = [found.get(app_id, []) for app_id in app_ids]
+
+            # When every game already has exactly one LaunchOptions value, only
+            # the values change: splice them in place and write the file once.
+            if all(len(matches) == 1 for matches in located):
+                return _replace_launch_options(
+                    content, app_ids, located, new_launch_options, localconfig_path, ask_if_exists
+                )
+
+            localconfig_data = read_vdf(localconfig_path)
+
+        backups = []
+        modified_count = 0
+        for app_id in app_ids:
+            if _apply_modify(localconfig_data, app_id, new_launch_options, ask_if_exists, backups):
+                print(f"✓ Modified game {app_id}: LaunchOptions set to '{new_launch_options}'")
+                modified_count += 1
+
+        if modified_count:
+            write_backup(backups)
+
+            # Write back to file once for all games
+            vdf_output = write_vdf(localconfig_data)
+            with open(localconfig_path, "w") as f:
+                f.write(vdf_output)
+
+        return modified_count
+
+    except Exception as e:
+        print(f"Error modifying LaunchOptions: {e}", file=sys.stderr)
+        return 0
+
+
+def _replace_launch_options(
+    content: bytes,
+    app_ids: list[str],
+    located: list[list[re.Match]],
+    new_launch_options: str,
+    localconfig_path: Path,
+    ask_if_exists: bool
+) -> int:
+    """
+    Replace existing LaunchOptions values located by _find_launch_options
+    in raw localconfig.vdf content, writing the file and backups once.
+    Returns the number of games modified.
+    """
+    new_value = new_launch_options.encode("utf-8")
+    backups = []
+    chunks = []
+    position = 0
+    for app_id, (match,) in zip(app_ids, located):
+        current_value = match.group(2).decode("utf-8", errors="replace")
+        if not _confirm_replace(app_id, current_value, new_launch_options, ask_if_exists):
+            continue
+
+        backups.append((app_id, current_value))
+        chunks.append((match.start(2), match.end(2)))
+        print(f"✓ Modified game {app_id}: LaunchOptions set to '{new_launch_options}'")
+
+    if backups:
+        write_backup(backups)
+
+        # Splice the new values in file order
+        with open(localconfig_path, "wb") as f:
+            for start, end in sorted(chunks):
+                f.write(content[position:start])
+                f.write(new_value)
+                position = end
+            f.write(content[position:])
+
+    return len(backups)
+
+
 def cmd_modify_launchoptions(game_id: str, config: dict) -> None:
     """Handle modify-launchoptions command for a single game."""
     if not game_id:
@@ -690,6 +1432,7 @@ def cmd_modify_all_launchoptions(config: dict) -> None:
     steam_config = config.get("steam", {})
     steam_path = steam_config.get("steam_path", "~/.local/share/Steam")
     launch_options_template = steam_config.get("launch_options_template", "protonhax init %COMMAND%")
+    excluded_patterns = steam_config.get("excluded_app_patterns", [])
 
     localconfig_path = find_localconfig_vdf(steam_path)
     if not localconfig_path:
@@ -699,7 +1442,8 @@ def cmd_modify_all_launchoptions(config: dict) -> None:
     print(f"Found localconfig.vdf at: {localconfig_path}")
 
     # Get installed games
-    installed_games = get_installed_games(steam_path)
+    steamapps_path = Path(steam_path).expanduser() / "steamapps"
+    installed_games, _ = get_installed_games(str(steamapps_path), excluded_patterns)
     if not installed_games:
         print("Warning: No installed games found", file=sys.stderr)
         return
@@ -713,14 +1457,10 @@ def cmd_modify_all_launchoptions(config: dict) -> None:
         print("Cancelled")
         return
 
-    modified_count = 0
-    skipped_count = 0
-
-    for app_id in installed_games:
-        if modify_launch_options(app_id, launch_options_template, localconfig_path, ask_if_exists=True):
-            modified_count += 1
-        else:
-            skipped_count += 1
+    modified_count = modify_launch_options_batch(
+        installed_games, launch_options_template, localconfig_path, ask_if_exists=True
+    )
+    skipped_count = len(installed_games) - modified_count
 
     print(f"\n{'='*50}")
     print(f"Summary:")
@@ -740,60 +1480,13 @@ def remove_launch_options(
     Returns True if removed, False otherwise.
     """
     try:
-        with open(localconfig_path, "r") as f:
-            content = f.read()
+        localconfig_data = read_vdf(localconfig_path)
 
-        localconfig_data = parse_vdf(content)
-
-        # Navigate to the app section
-        # Structure: Software -> Valve -> Steam -> apps -> <app_id>
-        try:
-            apps = (
-                localconfig_data
-                .get("Software", {})
-                .get("Valve", {})
-                .get("Steam", {})
-                .get("apps", {})
-            )
-
-            if app_id not in apps:
-                print(f"ℹ Game {app_id}: Not found in localconfig.vdf")
-                return False
-
-            app_section = apps[app_id]
-
-            if not isinstance(app_section, dict):
-                print(f"ℹ Game {app_id}: Invalid app section structure")
-                return False
-
-        except (KeyError, TypeError, AttributeError):
-            print(f"Error: Could not navigate to app {app_id} in localconfig.vdf", file=sys.stderr)
-            return False
-
-        # Check if LaunchOptions exists
-        if "LaunchOptions" not in app_section:
-            print(f"ℹ Game {app_id}: No LaunchOptions to remove")
+        backups = []
+        if not _apply_remove(localconfig_data, app_id, ask_if_exists, backups):
             return False
 
-        current_value = app_section["LaunchOptions"]
-
-        if ask_if_exists:
-            print(f"\n⚠ Game {app_id}:")
-            print(f"  Current value: {current_value}")
-            response = input(f"  Remove LaunchOptions? (y/n/skip): ").strip().lower()
-
-            if response == "skip" or response == "n":
-                print(f"  Skipped")
-                return False
-            elif response != "y":
-                print(f"  Invalid input, skipping")
-                return False
-
-        # Backup the value being removed
-        create_backup(app_id, current_value)
-
-        # Remove the LaunchOptions
-        del app_section["LaunchOptions"]
+        write_backup(backups)
 
         # Write back to file
         vdf_output = write_vdf(localconfig_data)
@@ -808,6 +1501,44 @@ def remove_launch_options(
         return False
 
 
+def remove_launch_options_batch(
+    app_ids: list[str],
+    localconfig_path: Path,
+    ask_if_exists: bool = True,
+    localconfig_data: dict | None = None
+) -> int:
+    """
+    Remove LaunchOptions for several games with a single read, parse and
+    write of localconfig.vdf, and a single backup write.
+    Already parsed localconfig_data can be passed in to skip the read.
+    Returns the number of games whose LaunchOptions were removed.
+    """
+    try:
+        if localconfig_data is None:
+            localconfig_data = read_vdf(localconfig_path)
+
+        backups = []
+        removed_count = 0
+        for app_id in app_ids:
+            if _apply_remove(localconfig_data, app_id, ask_if_exists, backups):
+                print(f"✓ Removed game {app_id}: LaunchOptions deleted")
+                removed_count += 1
+
+        if removed_count:
+            write_backup(backups)
+
+            # Write back to file once for all games
+            vdf_output = write_vdf(localconfig_data)
+            with open(localconfig_path, "w") as f:
+                f.write(vdf_output)
+
+        return removed_count
+
+    except Exception as e:
+        print(f"Error removing LaunchOptions: {e}", file=sys.stderr)
+        return 0
+
+
 def cmd_remove_launchoptions(game_id: str, config: dict) -> None:
     """Handle remove-launchoptions command for a single game."""
     if not game_id:
@@ -843,19 +1574,10 @@ def cmd_remove_all_launchoptions(config: dict) -> None:
     print(f"Found localconfig.vdf at: {localconfig_path}")
 
     # Parse the file to find games with LaunchOptions
-    with open(localconfig_path, "r") as f:
-        content = f.read()
-
-    localconfig_data = parse_vdf(content)
+    localconfig_data = read_vdf(localconfig_path)
 
     try:
-        apps = (
-            localconfig_data
-            .get("Software", {})
-            .get("Valve", {})
-            .get("Steam", {})
-            .get("apps", {})
-        )
+        apps = get_apps_section(localconfig_data)
 
         games_with_options = []
         for app_id, app_data in apps.items():
@@ -878,14 +1600,10 @@ def cmd_remove_all_launchoptions(config: dict) -> None:
         print("Cancelled")
         return
 
-    removed_count = 0
-    skipped_count = 0
-
-    for app_id in sorted(games_with_options):
-        if remove_launch_options(app_id, localconfig_path, ask_if_exists=True):
-            removed_count += 1
-        else:
-            skipped_count += 1
+    removed_count = remove_launch_options_batch(
+        sorted(games_with_options), localconfig_path, ask_if_exists=True, localconfig_data=localconfig_data
+    )
+    skipped_count = len(games_with_options) - removed_count
 
     print(f"\n{'='*50}")
     print(f"Summary:")
@@ -938,6 +1656,15 @@ def validate_steam_path(path_str: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def get_console() -> Console:
+    """
+    Get the shared Rich console used by the interactive menu and game screens.
+    Created on first use, so commands without a UI never construct it.
+    """
+    return Console()
+
+
 def display_interactive_menu(config: dict) -> None:
     """
     Display an interactive menu to browse and modify Steam games.
@@ -952,17 +1679,21 @@ def display_interactive_menu(config: dict) -> None:
     # Get installed games
 #    steamapps_path = Path(steam_path).expanduser().parent / "steamapps"
     steamapps_path = Path(steam_path).expanduser() / "steamapps"
-    included_games, excluded_games = get_installed_games(str(steamapps_path), excluded_patterns)
+    game_infos = {}
+    included_games, excluded_games = get_installed_games(str(steamapps_path), excluded_patterns, game_infos)
 
     if not included_games and not excluded_games:
         print("No installed games found", file=sys.stderr)
         return
 
+    # Parse localconfig.vdf once for the status of every game
+    statuses = get_all_launchoption_statuses(steam_path)
+
     # Prepare game data with status for included games only
     games_data = []
     for app_id in included_games:
-        game_info = get_game_info(app_id, str(steamapps_path))
-        status = get_launchoption_status(app_id, steam_path)
+        game_info = game_infos[app_id]
+        status = statuses.get(app_id, "Not Set") if statuses is not None else "Error"
         games_data.append({
             "app_id": app_id,
             "name": game_info["name"],
@@ -972,7 +1703,7 @@ def display_interactive_menu(config: dict) -> None:
 
     # Add excluded games with "Excluded" status
     for app_id in excluded_games:
-        game_info = get_game_info(app_id, str(steamapps_path))
+        game_info = game_infos[app_id]
         games_data.append({
             "app_id": app_id,
             "name": game_info["name"],
@@ -980,76 +1711,121 @@ def display_interactive_menu(config: dict) -> None:
             "excluded": True
         })
 
-    # Create console for output
-    console = Console()
+    # Get console for output
+    console = get_console()
+
+    # Create the table rows once; moving the selection only restyles the
+    # cells of the rows it leaves and enters
+    # Fixed column widths let Rich skip measuring every cell on each redraw.
+    # The name column is sized once from the data, capped at
+    # MENU_NAME_MAX_WIDTH and at the room left next to the other columns.
+    name_width = min(
+        MENU_NAME_MAX_WIDTH,
+        max(len("Game Name"), *(cell_len(game["name"]) for game in games_data)),
+        max(len("Game Name"), console.width - MENU_ID_WIDTH - MENU_STATUS_WIDTH - MENU_TABLE_OVERHEAD_WIDTH),
+    )
+    rows = []
+    for game in games_data:
+        # Excluded games shown in gray, never selectable
+        style = "dim" if game["excluded"] else ""
+        rows.append((
+            Text(game["app_id"], style=style),
+            Text(game["name"], style=style),
+            Text(game["status"], style=style),
+        ))
+
+    def set_highlight(idx: int, selected: bool) -> None:
+        """Highlight or un-highlight the cells of a selectable row."""
+        if not games_data[idx]["excluded"]:
+            for cell in rows[idx]:
+                cell.style = "bold white on blue" if selected else ""
 
-    # Create the interactive table
     current_selection = 0
-
-    while True:
-        console.clear()
-
-        # Create table
-        table = Table(title="Steam Games", show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan", width=10)
-        table.add_column("Game Name", style="green")
-        table.add_column("LaunchOption Status", style="yellow")
-
-        # Add rows with highlighting for selected row
-        for idx, game in enumerate(games_data):
-            if game["excluded"]:
-                # Excluded games shown in gray, never selectable
-                id_text = Text(game["app_id"], style="dim")
-                name_text = Text(game["name"], style="dim")
-                status_text = Text(game["status"], style="dim")
-            elif idx == current_selection:
-                # Highlight selected row
-                id_text = Text(game["app_id"], style="bold white on blue")
-                name_text = Text(game["name"], style="bold white on blue")
-                status_text = Text(game["status"], style="bold white on blue")
-            else:
-                id_text = Text(game["app_id"])
-                name_text = Text(game["name"])
-                status_text = Text(game["status"])
-
-            table.add_row(id_text, name_text, status_text)
-
-        console.print(table)
-        console.print("\n[cyan]Navigation:[/cyan] Use [bold]↑[/bold]/[bold]↓[/bold] to move, [bold]Enter[/bold] to select, [bold]Q[/bold]/[bold]Esc[/bold] to quit")
-        if excluded_games:
-            console.print(f"\n[dim]Showing {len(included_games)} games ({len(excluded_games)} excluded)[/dim]")
-
-        # Get keyboard input
-        try:
-            key = get_key()
-
-            if key == "up":
-                current_selection = max(0, current_selection - 1)
-                # Skip excluded games when navigating up
-                while current_selection > 0 and games_data[current_selection]["excluded"]:
-                    current_selection -= 1
-            elif key == "down":
-                current_selection = min(len(games_data) - 1, current_selection + 1)
-                # Skip excluded games when navigating down
-                while current_selection < len(games_data) - 1 and games_data[current_selection]["excluded"]:
-                    current_selection += 1
-            elif key == "enter":
-                selected_game = games_data[current_selection]
-                # Prevent selecting excluded games
-                if not selected_game["excluded"]:
-                    handle_game_selection(selected_game, config, steam_path, launch_options_template)
-                    current_selection = 0  # Reset selection after action
-                else:
-                    console.print("[yellow]Cannot modify excluded games[/yellow]")
-            elif key in ["q", "esc"]:
-                console.print("[yellow]Exiting menu...[/yellow]")
+    set_highlight(current_selection, True)
+
+    footer = Text.from_markup("\n[cyan]Navigation:[/cyan] Use [bold]↑[/bold]/[bold]↓[/bold] to move, [bold]Enter[/bold] to select, [bold]Q[/bold]/[bold]Esc[/bold] to quit")
+    if excluded_games:
+        footer.append_text(Text.from_markup(f"\n\n[dim]Showing {len(included_games)} games ({len(excluded_games)} excluded)[/dim]"))
+
+    # Only the rows that fit on screen are rendered, so the menu never grows
+    # taller than the terminal and can always be redrawn in place
+    footer_lines = footer.plain.count("\n") + 1
+
+    def render(top: int, height: int) -> Group:
+        """Build the table for the rows from top that fit in height lines."""
+        table = Table(title="Steam Games", show_header=True, header_style="bold magenta", expand=False)
+        table.add_column("ID", style="cyan", width=MENU_ID_WIDTH, no_wrap=True)
+        table.add_column("Game Name", style="green", width=name_width, no_wrap=True, overflow="ellipsis")
+        table.add_column("LaunchOption Status", style="yellow", width=MENU_STATUS_WIDTH, no_wrap=True)
+        for row in rows[top:top + height]:
+            table.add_row(*row)
+        return Group(table, footer)
+
+    top = 0
+    height = max(1, console.height - MENU_TABLE_CHROME_LINES - footer_lines)
+
+    # Redraw the menu in place after each keypress instead of clearing and
+    # reprinting the whole screen
+    console.clear()
+    with Live(render(top, height), console=console, auto_refresh=False) as live:
+        while True:
+            # Get keyboard input
+            try:
+                key = get_key()
+                previous_selection = current_selection
+
+                if key == "up":
+                    current_selection = max(0, current_selection - 1)
+                    # Skip excluded games when navigating up
+                    while current_selection > 0 and games_data[current_selection]["excluded"]:
+                        current_selection -= 1
+                elif key == "down":
+                    current_selection = min(len(games_data) - 1, current_selection + 1)
+                    # Skip excluded games when navigating down
+                    while current_selection < len(games_data) - 1 and games_data[current_selection]["excluded"]:
+                        current_selection += 1
+                elif key == "enter":
+                    selected_game = games_data[current_selection]
+                    # Prevent selecting excluded games
+                    if not selected_game["excluded"]:
+                        # The game screen takes over the terminal until it returns
+                        live.stop()
+                        handle_game_selection(selected_game, config, steam_path, launch_options_template)
+
+                        # Actions on all games can change any row, so refresh every
+                        # status from one parse of the updated file
+                        statuses = get_all_launchoption_statuses(steam_path)
+                        for game, row in zip(games_data, rows):
+                            if not game["excluded"]:
+                                game["status"] = statuses.get(game["app_id"], "Not Set") if statuses is not None else "Error"
+                                row[2].plain = game["status"]
+                        current_selection = 0  # Reset selection after action
+                        console.clear()
+                        live.start()
+                    else:
+                        console.print("[yellow]Cannot modify excluded games[/yellow]")
+                elif key in ["q", "esc"]:
+                    console.print("[yellow]Exiting menu...[/yellow]")
+                    break
+
+                if current_selection != previous_selection:
+                    set_highlight(previous_selection, False)
+                    set_highlight(current_selection, True)
+
+                # Scroll the selection into view, rebuilding the table only
+                # when the visible window moves or the terminal is resized
+                new_height = max(1, console.height - MENU_TABLE_CHROME_LINES - footer_lines)
+                new_top = min(max(top, current_selection - new_height + 1), current_selection)
+                if new_top != top or new_height != height:
+                    top, height = new_top, new_height
+                    live.update(render(top, height))
+                live.refresh()
+            except KeyboardInterrupt:
+                console.print("\n[yellow]Menu cancelled[/yellow]")
+                break
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
                 break
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Menu cancelled[/yellow]")
-            break
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
-            break
 
 
 def get_key() -> str:
@@ -1057,89 +1833,131 @@ def get_key() -> str:
     Get keyboard input from user.
     Returns: 'up', 'down', 'enter', 'q', 'esc', or the character
     """
-    import sys
-    import tty
-    import termios
-
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
 
     try:
-        tty.setraw(fd)
-        ch = sys.stdin.read(1)
-
-        if ch == '\x1b':  # Escape sequence
-            next_chars = sys.stdin.read(2)
-            if next_chars == '[A':
-                return 'up'
-            elif next_chars == '[B':
-                return 'down'
-            elif next_chars == '[':
-                # Handle other escape sequences
-                ch2 = sys.stdin.read(1)
-                if ch2 == 'Z':  # Shift+Tab
-                    return 'up'
-                return 'unknown'
-            return 'esc'
-        elif ch == '\r' or ch == '\n':
-            return 'enter'
-        elif ch.lower() == 'q':
-            return 'q'
-        else:
-            return ch.lower()
+        # Unbuffered, no echo, and a truly blocking read: wait for at least
+        # one byte with no inter-byte timer
+        new_settings = termios.tcgetattr(fd)
+        new_settings[3] &= ~(termios.ICANON | termios.ECHO)
+        new_settings[6][termios.VMIN] = 1
+        new_settings[6][termios.VTIME] = 0
+        termios.tcsetattr(fd, termios.TCSADRAIN, new_settings)
+
+        # Only read when no keys are left over from an earlier read
+        start, end = _KEY_PENDING
+        if start == end:
+            start, end = 0, os.readv(fd, [_KEY_BUFFER])
+            if end == 0:
+                return ''
+
+        # The rest of an escape sequence can arrive in later reads (e.g. over
+        # SSH, tmux or a slow tty), so wait briefly for it before deciding
+        # that ESC was pressed on its own
+        while end - start < 3 and _KEY_BUFFER[start] == 0x1b:
+            if end == len(_KEY_BUFFER):
+                # Move the partial sequence to the front to make room
+                _KEY_BUFFER[:end - start] = _KEY_BUFFER[start:end]
+                start, end = 0, end - start
+            if not select.select([fd], [], [], ESCAPE_SEQUENCE_TIMEOUT)[0]:
+                break
+            more = os.readv(fd, [memoryview(_KEY_BUFFER)[end:]])
+            if more == 0:
+                break
+            end += more
+
+        key, length = _parse_key(start, end)
+        _KEY_PENDING[:] = [start + length, end]
+        return key
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
+def _parse_key(start: int, end: int) -> tuple[str, int]:
+    """
+    Parse the first key of the pending bytes _KEY_BUFFER[start:end].
+    Returns the key as get_key reports it and the number of bytes it used.
+    """
+    first = _KEY_BUFFER[start]
+    if first == 0x1b:  # Escape sequence
+        if end - start == 1:
+            return 'esc', 1
+
+        if _KEY_BUFFER[start + 1] == 0x5b:  # '[', runs up to its final byte
+            final_index = start + 2
+            while final_index < end and not 0x40 <= _KEY_BUFFER[final_index] <= 0x7e:
+                final_index += 1
+            if final_index == start + 2 and final_index < end:
+                final = _KEY_BUFFER[final_index]
+                if final == 0x41:  # 'A'
+                    return 'up', 3
+                elif final == 0x42:  # 'B'
+                    return 'down', 3
+                elif final == 0x5a:  # 'Z', Shift+Tab
+                    return 'up', 3
+            # Handle other escape sequences
+            return 'unknown', min(final_index + 1, end) - start
+
+        # ESC O plus one byte (e.g. F1-F4), or Alt plus a key
+        length = 3 if _KEY_BUFFER[start + 1] == 0x4f else 2
+        return 'unknown', min(length, end - start)
+    elif first == 0x0d or first == 0x0a:  # '\r' or '\n'
+        return 'enter', 1
+    elif first == 0x71 or first == 0x51:  # 'q' or 'Q'
+        return 'q', 1
+    else:
+        # Only other keys are decoded, one UTF-8 character, to report the
+        # character itself
+        length = 1 if first < 0xc0 else 2 if first < 0xe0 else 3 if first < 0xf0 else 4
+        length = min(length, end - start)
+        return bytes(_KEY_BUFFER[start:start + length]).decode(errors="replace").lower(), length
+
+
+def press_any_key(message: str = "Press any key to continue...") -> None:
+    """Show a message and wait for a single keypress."""
+    get_console().print(message)
+    get_key()
+
+
 def handle_game_selection(game: dict, config: dict, steam_path: str, launch_options_template: str) -> None:
     """
     Handle the menu options for a selected game.
     """
-    from rich.console import Console
-    from rich.prompt import Prompt
+    console = get_console()
 
-    console = Console()
+    # Resolve localconfig.vdf once for every action on this screen
+    localconfig_path = find_localconfig_vdf(steam_path)
 
     while True:
         console.clear()
-        console.print(f"\n[bold blue]Selected Game:[/bold blue] {game['name']} (ID: {game['app_id']})")
-        console.print(f"[yellow]LaunchOption Status: {game['status']}[/yellow]\n")
-
-        console.print("[cyan]Options:[/cyan]")
-        console.print("[bold]M[/bold] - Modify LaunchOptions")
-        console.print("[bold]V[/bold] - View Current LaunchOptions")
-        console.print("[bold]R[/bold] - Remove LaunchOptions")
-        console.print("[bold]A[/bold] - Modify All Games LaunchOptions")
-        console.print("[bold]D[/bold] - Remove All Games LaunchOptions")
-        console.print("[bold]C[/bold] - Cancel (back to menu)\n")
+        # Render the header and the option list in a single print
+        console.print(Text.assemble(
+            "\n",
+            ("Selected Game:", "bold blue"),
+            f" {game['name']} (ID: {game['app_id']})\n",
+            (f"LaunchOption Status: {game['status']}", "yellow"),
+            "\n\n",
+            GAME_OPTIONS_TEXT,
+        ))
 
         choice = Prompt.ask("[cyan]Choose option[/cyan]", choices=["m", "v", "r", "a", "d", "c"], show_default=False).lower()
 
         if choice == "m":
-            localconfig_path = find_localconfig_vdf(steam_path)
             if localconfig_path:
-                modify_launch_options(game["app_id"], launch_options_template, localconfig_path, ask_if_exists=True)
-                game["status"] = get_launchoption_status(game["app_id"], steam_path)
+                # The outcome is known, so update the status without re-reading the file
+                if modify_launch_options(game["app_id"], launch_options_template, localconfig_path, ask_if_exists=True):
+                    game["status"] = "Configured"
                 console.print("\n[green]LaunchOptions updated.[/green]")
-                input("Press Enter to continue...")
+                press_any_key()
             else:
                 console.print("[red]Error: Could not find localconfig.vdf[/red]")
-                input("Press Enter to continue...")
+                press_any_key()
         elif choice == "v":
-            localconfig_path = find_localconfig_vdf(steam_path)
             if localconfig_path:
                 try:
-                    with open(localconfig_path, "r") as f:
-                        content = f.read()
-                    localconfig_data = parse_vdf(content)
-
-                    apps = (
-                        localconfig_data
-                        .get("Software", {})
-                        .get("Valve", {})
-                        .get("Steam", {})
-                        .get("apps", {})
-                    )
+                    # Served from the memoized parse while the file is unchanged
+                    apps = _collect_apps_section(localconfig_path)
 
                     if game["app_id"] in apps and "LaunchOptions" in apps[game["app_id"]]:
                         launch_options = apps[game["app_id"]]["LaunchOptions"]
@@ -1147,26 +1965,24 @@ def handle_game_selection(game: dict, config: dict, steam_path: str, launch_opti
                     else:
                         console.print("\n[yellow]No LaunchOptions configured for this game[/yellow]")
 
-                    input("\nPress Enter to continue...")
+                    press_any_key("\nPress any key to continue...")
                 except Exception as e:
                     console.print(f"[red]Error reading LaunchOptions: {e}[/red]")
-                    input("Press Enter to continue...")
+                    press_any_key()
             else:
                 console.print("[red]Error: Could not find localconfig.vdf[/red]")
-                input("Press Enter to continue...")
+                press_any_key()
         elif choice == "r":
-            localconfig_path = find_localconfig_vdf(steam_path)
             if localconfig_path:
-                remove_launch_options(game["app_id"], localconfig_path, ask_if_exists=True)
-                game["status"] = get_launchoption_status(game["app_id"], steam_path)
+                if remove_launch_options(game["app_id"], localconfig_path, ask_if_exists=True):
+                    game["status"] = "Not Set"
                 console.print("\n[green]LaunchOptions removed if they existed.[/green]")
-                input("Press Enter to continue...")
+                press_any_key()
             else:
                 console.print("[red]Error: Could not find localconfig.vdf[/red]")
-                input("Press Enter to continue...")
+                press_any_key()
         elif choice == "a":
             # Modify all games LaunchOptions (excluding excluded games)
-            localconfig_path = find_localconfig_vdf(steam_path)
             if localconfig_path:
                 excluded_patterns = config.get("steam", {}).get("excluded_app_patterns", [])
                 included_games, excluded_games = get_installed_games(str(Path(steam_path).expanduser() / "steamapps"), excluded_patterns)
@@ -1178,13 +1994,10 @@ def handle_game_selection(game: dict, config: dict, steam_path: str, launch_opti
                         console.print("[/yellow]")
                     response = input(f"\nModify LaunchOptions for {len(included_games)} games? (y/n): ").strip().lower()
                     if response == "y":
-                        modified_count = 0
-                        skipped_count = 0
-                        for app_id in included_games:
-                            if modify_launch_options(app_id, launch_options_template, localconfig_path, ask_if_exists=False):
-                                modified_count += 1
-                            else:
-                                skipped_count += 1
+                        modified_count = modify_launch_options_batch(
+                            included_games, launch_options_template, localconfig_path, ask_if_exists=False
+                        )
+                        skipped_count = len(included_games) - modified_count
 
                         console.print(f"\n[green]Summary:[/green]")
                         console.print(f"  Modified:  {modified_count}")
@@ -1192,32 +2005,23 @@ def handle_game_selection(game: dict, config: dict, steam_path: str, launch_opti
                         console.print(f"  Processed: {len(included_games)}")
                         if excluded_games:
                             console.print(f"  Excluded:  {len(excluded_games)}")
-                        input("Press Enter to continue...")
+                        press_any_key()
                     else:
                         console.print("[cyan]Cancelled[/cyan]")
-                        input("Press Enter to continue...")
+                        press_any_key()
                 else:
                     console.print("[red]Error: No available games found (all are excluded or none installed)[/red]")
-                    input("Press Enter to continue...")
+                    press_any_key()
             else:
                 console.print("[red]Error: Could not find localconfig.vdf[/red]")
-                input("Press Enter to continue...")
+                press_any_key()
         elif choice == "d":
             # Remove all games LaunchOptions (excluding excluded games)
-            localconfig_path = find_localconfig_vdf(steam_path)
             if localconfig_path:
                 try:
-                    with open(localconfig_path, "r") as f:
-                        content = f.read()
-                    localconfig_data = parse_vdf(content)
-
-                    apps = (
-                        localconfig_data
-                        .get("Software", {})
-                        .get("Valve", {})
-                        .get("Steam", {})
-                        .get("apps", {})
-                    )
+                    localconfig_data = read_vdf(localconfig_path)
+
+                    apps = get_apps_section(localconfig_data)
 
                     # Get excluded patterns to filter out
                     excluded_patterns = config.get("steam", {}).get("excluded_app_patterns", [])
@@ -1245,13 +2049,11 @@ def handle_game_selection(game: dict, config: dict, steam_path: str, launch_opti
                             console.print("[/yellow]")
                         response = input(f"\nRemove LaunchOptions for {len(games_with_options)} games? (y/n): ").strip().lower()
                         if response == "y":
-                            removed_count = 0
-                            skipped_count = 0
-                            for app_id in sorted(games_with_options):
-                                if remove_launch_options(app_id, localconfig_path, ask_if_exists=False):
-                                    removed_count += 1
-                                else:
-                                    skipped_count += 1
+                            removed_count = remove_launch_options_batch(
+                                sorted(games_with_options), localconfig_path, ask_if_exists=False,
+                                localconfig_data=localconfig_data
+                            )
+                            skipped_count = len(games_with_options) - removed_count
 
                             console.print(f"\n[green]Summary:[/green]")
                             console.print(f"  Removed:   {removed_count}")
@@ -1259,23 +2061,23 @@ def handle_game_selection(game: dict, config: dict, steam_path: str, launch_opti
                             console.print(f"  Processed: {len(games_with_options)}")
                             if excluded_with_options:
                                 console.print(f"  Excluded:  {len(excluded_with_options)}")
-                            input("Press Enter to continue...")
+                            press_any_key()
                         else:
                             console.print("[cyan]Cancelled[/cyan]")
-                            input("Press Enter to continue...")
+                            press_any_key()
                     else:
                         console.print("[yellow]No available games with LaunchOptions found")
                         if excluded_with_options:
                             console.print(f"({len(excluded_with_options)} excluded games have LaunchOptions but cannot be modified)[/yellow]")
                         else:
                             console.print("[/yellow]")
-                        input("Press Enter to continue...")
+                        press_any_key()
                 except Exception as e:
                     console.print(f"[red]Error: {e}[/red]")
-                    input("Press Enter to continue...")
+                    press_any_key()
             else:
                 console.print("[red]Error: Could not find localconfig.vdf[/red]")
-                input("Press Enter to continue...")
+                press_any_key()
         elif choice == "c":
             console.print("[cyan]Returning to game list...[/cyan]")
             break
@@ -1283,41 +2085,28 @@ def handle_game_selection(game: dict, config: dict, steam_path: str, launch_opti
 
 def validate_protonhax_installed() -> str:
     """
-    Validate that protonhax is installed by executing 'which protonhax'.
+    Validate that protonhax is installed by searching PATH for it.
     Returns the path if found, otherwise exits with error.
     """
-    try:
-        result = subprocess.run(
-            ["which", "protonhax"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        path = result.stdout.strip()
-
-        # Verify it's the expected path
-        if path == "/usr/bin/protonhax":
-            return path
-        else:
-            # Allow other paths but warn the user
-            print(f"⚠ Warning: protonhax found at {path}, expected /usr/bin/protonhax", file=sys.stderr)
-            return path
+    path = shutil.which("protonhax")
 
-    except subprocess.CalledProcessError:
+    if path is None:
         print("Error: 'protonhax' command not found in PATH", file=sys.stderr)
         print("\nPlease install protonhax from: https://github.com/mikeslattery/protonhax", file=sys.stderr)
         sys.exit(1)
-    except FileNotFoundError:
-        print("Error: 'which' command not found", file=sys.stderr)
-        print("\nPlease ensure protonhax is installed from: https://github.com/mikeslattery/protonhax", file=sys.stderr)
-        sys.exit(1)
+
+    # Verify it's the expected path
+    if path == "/usr/bin/protonhax":
+        return path
+    else:
+        # Allow other paths but warn the user
+        print(f"⚠ Warning: protonhax found at {path}, expected /usr/bin/protonhax", file=sys.stderr)
+        return path
 
 
 def cmd_init() -> None:
     """Handle init command for guided configuration setup."""
-    print("=" * 60)
-    print("CheatEngine Auto-Start Configuration Setup")
-    print("=" * 60)
+    print(INIT_BANNER)
 
     # Validate protonhax is installed
     print("\nValidating protonhax installation...")
@@ -1328,11 +2117,11 @@ def cmd_init() -> None:
     config_path = get_config_path()
     print(f"\nConfig file will be saved to: {config_path}")
 
-    # Try to load existing config for defaults
+    # Try to load existing config for defaults, reusing the cached parse
+    # while the file is unchanged
     existing_config = {}
     try:
-        with open(config_path, "rb") as f:
-            existing_config = tomllib.load(f)
+        existing_config = _load_toml(config_path)
     except (FileNotFoundError, OSError):
         pass
 
@@ -1506,13 +2295,17 @@ def cmd_start(uid: str | None, config: dict, alternative_exe: str | None = None)
             sys.exit(1)
         executable_path = config["cheatengine"]["executable_path"]
 
+    steam_config = config.get("steam", {})
+    # The game title is only printed, so don't look it up when nobody is
+    # watching the output (e.g. when launched from a hotkey or script)
+    lookup_enabled = steam_config.get("lookup_enabled", False) and sys.stdout.isatty()
+
     # Get running game uid if not provided
     if not uid:
         uid = get_running_game_uid()
 
     # Look up game title if enabled
-    steam_config = config.get("steam", {})
-    if steam_config.get("lookup_enabled", False):
+    if lookup_enabled:
         # Get Steam path from config, with default fallback
         steam_path = steam_config.get("steam_path", "~/.local/share/Steam/steamapps")
         print(f"Looking up game title...")
@@ -1526,6 +2319,42 @@ def cmd_start(uid: str | None, config: dict, alternative_exe: str | None = None)
     launch_cheatengine(uid, executable_path)
 
 
+def _start_command(args: list[str], config: dict) -> None:
+    """Parse start command arguments: [uid] [--exe PATH], then run it."""
+    uid = None
+    alternative_exe = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == "--exe" or args[i] == "-e":
+            if i + 1 < len(args):
+                alternative_exe = args[i + 1]
+                i += 2
+            else:
+                print("Error: --exe flag requires a path argument", file=sys.stderr)
+                sys.exit(1)
+        elif not uid and not args[i].startswith("-"):
+            # First non-flag argument is the UID
+            uid = args[i]
+            i += 1
+        else:
+            print(f"Error: Unknown argument '{args[i]}'", file=sys.stderr)
+            sys.exit(1)
+
+    cmd_start(uid, config, alternative_exe)
+
+
+# Commands that need the config, each called as handler(args, config)
+COMMANDS = {
+    "start": _start_command,
+    "menu": lambda args, config: display_interactive_menu(config),
+    "modify-launchoptions": lambda args, config: cmd_modify_launchoptions(args[0] if args else None, config),
+    "modify-all-launchoptions": lambda args, config: cmd_modify_all_launchoptions(config),
+    "remove-launchoptions": lambda args, config: cmd_remove_launchoptions(args[0] if args else None, config),
+    "remove-all-launchoptions": lambda args, config: cmd_remove_all_launchoptions(config),
+}
+
+
 def main() -> None:
     """Main entry point."""
     # Parse command-line arguments
@@ -1541,55 +2370,15 @@ def main() -> None:
         cmd_init()
         return
 
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        sys.stderr.write(f"Error: Unknown command '{cmd}'\n\n{USAGE}")
+        sys.exit(1)
+
     # Load config for all other commands
     config = load_config()
 
-    if cmd == "start":
-        # Parse start command arguments: [uid] [--exe PATH]
-        uid = None
-        alternative_exe = None
-
-        i = 0
-        while i < len(args):
-            if args[i] == "--exe" or args[i] == "-e":
-                if i + 1 < len(args):
-                    alternative_exe = args[i + 1]
-                    i += 2
-                else:
-                    print("Error: --exe flag requires a path argument", file=sys.stderr)
-                    sys.exit(1)
-            elif not uid and not args[i].startswith("-"):
-                # First non-flag argument is the UID
-                uid = args[i]
-                i += 1
-            else:
-                print(f"Error: Unknown argument '{args[i]}'", file=sys.stderr)
-                sys.exit(1)
-
-        cmd_start(uid, config, alternative_exe)
-    elif cmd == "menu":
-        display_interactive_menu(config)
-    elif cmd == "modify-launchoptions":
-        arg = args[0] if args else None
-        cmd_modify_launchoptions(arg, config)
-    elif cmd == "modify-all-launchoptions":
-        cmd_modify_all_launchoptions(config)
-    elif cmd == "remove-launchoptions":
-        arg = args[0] if args else None
-        cmd_remove_launchoptions(arg, config)
-    elif cmd == "remove-all-launchoptions":
-        cmd_remove_all_launchoptions(config)
-    else:
-        print(f"Error: Unknown command '{cmd}'", file=sys.stderr)
-        print("\nUsage:", file=sys.stderr)
-        print("  ce-autostart.py init                            - Interactive configuration setup", file=sys.stderr)
-        print("  ce-autostart.py [start] [uid] [--exe PATH]      - Start CheatEngine for a game", file=sys.stderr)
-        print("  ce-autostart.py menu                            - Interactive game browser and manager", file=sys.stderr)
-        print("  ce-autostart.py modify-launchoptions <ID>       - Set LaunchOptions for a game", file=sys.stderr)
-        print("  ce-autostart.py modify-all-launchoptions        - Set LaunchOptions for all games", file=sys.stderr)
-        print("  ce-autostart.py remove-launchoptions <ID>       - Remove LaunchOptions from a game", file=sys.stderr)
-        print("  ce-autostart.py remove-all-launchoptions        - Remove LaunchOptions from all games", file=sys.stderr)
-        sys.exit(1)
+    handler(args, config)
 
 
 if __name__ == "__main__":